@@ -159,6 +159,13 @@ class TimeSeriesForestClassifier(
             Predicted probabilities
         """
         X = X.squeeze(1)
+
+        _, series_length = X.shape
+        if series_length != self.series_length:
+            raise TypeError(
+                "The number of time points in the training data does not match "
+                "that in the test data."
+            )
         y_probas = Parallel(n_jobs=self.n_jobs)(
             delayed(_predict_single_classifier_proba)(
                 X, self.estimators_[i], self.intervals_[i]
@@ -0,0 +1,83 @@
+"""TimeSeriesForest test code."""
+import numpy as np
+import pytest
+
+from sktime.classification.interval_based import TimeSeriesForestClassifier
+from sktime.datasets import load_unit_test
+from sktime.series_as_features.base.estimators.interval_based._tsf import (
+    _get_intervals,
+    _transform,
+    _transform_numpy,
+)
+from sktime.utils.slope_and_trend import _slope
+
+
+def _naive_transform(X, intervals):
+    """Per-interval mean/std/slope reference, the pre-optimization transform."""
+    n_instances, _ = X.shape
+    n_intervals, _ = intervals.shape
+    transformed_x = np.empty((3 * n_intervals, n_instances), dtype=np.float32)
+    for j in range(n_intervals):
+        X_slice = X[:, intervals[j][0] : intervals[j][1]]
+        transformed_x[3 * j] = np.mean(X_slice, axis=1)
+        transformed_x[3 * j + 1] = np.std(X_slice, axis=1)
+        transformed_x[3 * j + 2] = _slope(X_slice, axis=1)
+    return transformed_x.T
+
+
+def test_transform_equivalence():
+    """Transform matches the naive per-interval statistics on unit test data."""
+    X, _ = load_unit_test(split="train", return_type="numpy2D")
+    rng = np.random.RandomState(0)
+    intervals = _get_intervals(10, 3, X.shape[1], rng)
+
+    expected = _naive_transform(X, intervals)
+    for Xt in (_transform(X, intervals), _transform_numpy(X, intervals)):
+        assert Xt.dtype == np.float32
+        assert Xt.flags["C_CONTIGUOUS"]
+        np.testing.assert_allclose(Xt, expected, rtol=1e-4, atol=1e-4)
+
+    # float32 input, as used on the fit path, agrees within float32 precision
+    Xt32 = _transform(X.astype(np.float32), intervals)
+    np.testing.assert_allclose(Xt32, expected, rtol=1e-3, atol=1e-3)
+
+
+def test_transform_long_series():
+    """Slopes stay correct on long series, where int64 moments would overflow."""
+    rng = np.random.RandomState(42)
+    X = rng.normal(size=(2, 120000))
+    intervals = _get_intervals(5, 3, X.shape[1], rng)
+
+    expected = _naive_transform(X, intervals)
+    Xt = _transform_numpy(X, intervals)
+    np.testing.assert_allclose(Xt, expected, rtol=1e-3, atol=1e-6)
+
+
+def test_tsf_on_unit_test_data():
+    """Test of TimeSeriesForestClassifier on unit test data."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, y_test = load_unit_test(split="test")
+
+    tsf = TimeSeriesForestClassifier(n_estimators=10, random_state=0)
+    tsf.fit(X_train, y_train)
+
+    score = tsf.score(X_test, y_test)
+    assert score >= 0.8
+
+
+def test_tsf_rejects_mismatched_series_length():
+    """Predicting on series shorter than the training series raises."""
+    X, _ = load_unit_test(split="train", return_type="numpy2D")
+    rng = np.random.RandomState(0)
+    intervals = _get_intervals(5, 3, X.shape[1], rng)
+
+    with pytest.raises(ValueError, match="beyond the series length"):
+        _transform(X[:, : X.shape[1] // 2], intervals)
+
+    X_train, y_train = load_unit_test(split="train")
+    tsf = TimeSeriesForestClassifier(n_estimators=2, random_state=0)
+    tsf.fit(X_train, y_train)
+
+    X_short = rng.normal(size=(5, 1, X.shape[1] // 2))
+    with pytest.raises(TypeError, match="number of time points"):
+        tsf.predict(X_short)
@@ -319,10 +319,12 @@ class BaseTimeSeriesForest(BaseForest):
         # get number of estimators
         n_estimators = len(self.estimators_)
 
-        # preallocate array for feature importances
-        fis = np.zeros((n_timepoints, n_features))
+        # adding a weight over a time interval is a range update: add the
+        # weight at the interval start, subtract it at the end, and recover
+        # the per-timepoint accumulation with one cumulative sum at the end
+        diffs = np.zeros((n_timepoints + 1, n_features))
         if normalise_time_points:
-            fis_count = np.zeros((n_timepoints, n_features))
+            count_diffs = np.zeros((n_timepoints + 1, n_features))
 
         for i in range(n_estimators):
             # select tree
@@ -331,28 +333,23 @@ class BaseTimeSeriesForest(BaseForest):
             classifier = tree.steps[-1][1]
 
             # get intervals from transformer
-            intervals = transformer.intervals_
+            intervals = np.asarray(transformer.intervals_)
+            starts = intervals[:, 0]
+            ends = intervals[:, 1]
 
-            # get feature importances from classifier
-            fi = classifier.feature_importances_
+            # get feature importances from classifier, where column
+            # (k * n_intervals) + j holds feature k over interval j
+            fi = classifier.feature_importances_.reshape(n_features, n_intervals)
 
-            for k in range(n_features):
-                for j in range(n_intervals):
-                    # get start and end point from interval
-                    start, end = intervals[j]
+            np.add.at(diffs, starts, fi.T)
+            np.add.at(diffs, ends, -fi.T)
+            if normalise_time_points:
+                np.add.at(count_diffs, starts, 1.0)
+                np.add.at(count_diffs, ends, -1.0)
 
-                    # get time index for interval
-                    interval_time_points = np.arange(start, end)
-
-                    # get index for feature importances,
-                    # assuming particular order of features
-
-                    column_index = (k * n_intervals) + j
-
-                    # add feature importance for all time points of interval
-                    fis[interval_time_points, k] += fi[column_index]
-                    if normalise_time_points:
-                        fis_count[interval_time_points, k] += 1
+        fis = np.cumsum(diffs[:-1], axis=0)
+        if normalise_time_points:
+            fis_count = np.cumsum(count_diffs[:-1], axis=0)
 
         # normalise by number of estimators and number of intervals
         fis = fis / n_estimators / n_intervals
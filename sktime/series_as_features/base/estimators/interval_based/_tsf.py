@@ -12,6 +12,7 @@ __all__ = [
     "BaseTimeSeriesForest",
     "_transform",
     "_get_intervals",
+    "_get_all_intervals",
     "_fit_estimator",
 ]
 
@@ -19,12 +20,51 @@ import math
 
 import numpy as np
 from joblib import Parallel, delayed
-from sklearn.utils.multiclass import class_distribution
 from sklearn.utils.validation import check_random_state
 
 from sktime.base._base import _clone_estimator
-from sktime.utils.slope_and_trend import _slope
 from sktime.utils.validation import check_n_jobs
+from sktime.utils.validation._dependencies import _check_soft_dependencies
+
+_NUMBA_PRESENT = _check_soft_dependencies("numba", severity="none")
+
+# per-series-length slope constants for the numba kernel, keyed by length
+_SLOPE_TABLES = {}
+
+
+def _slope_tables(series_length):
+    """Per-interval-length slope constants for the numba transform kernel.
+
+    For an interval of length L with time index t = 0..L-1, the slope
+    denominator ``L * sum(t ** 2) - sum(t) ** 2`` depends only on L, so both
+    ``sum(t)`` and the reciprocal of the denominator are tabulated once per
+    series length and the kernel reduces the slope to a single multiply.
+    Entries where the denominator is zero (L < 2) are set to zero.
+    """
+    tables = _SLOPE_TABLES.get(series_length)
+    if tables is None:
+        lengths = np.arange(series_length + 1, dtype=np.float64)
+        t_sum = lengths * (lengths - 1) / 2.0
+        t_sq_sum = (lengths - 1) * lengths * (2.0 * lengths - 1.0) / 6.0
+        denom = lengths * t_sq_sum - t_sum * t_sum
+        slope_norm = np.zeros(series_length + 1)
+        np.divide(1.0, denom, out=slope_norm, where=denom > 0)
+        tables = _SLOPE_TABLES[series_length] = (t_sum, slope_norm)
+    return tables
+
+
+def _sklearn_estimator_attr():
+    """Name of the sklearn BaseForest estimator attribute, resolved once.
+
+    The attribute was renamed from base_estimator to estimator in sklearn 1.2.0.
+    """
+    import sklearn
+
+    major, minor = (int(part) for part in sklearn.__version__.split(".")[:2])
+    return "estimator" if (major, minor) >= (1, 2) else "base_estimator"
+
+
+_SKLEARN_ESTIMATOR_ATTR = _sklearn_estimator_attr()
 
 
 class BaseTimeSeriesForest:
@@ -61,17 +101,10 @@ class BaseTimeSeriesForest:
     def _estimator(self):
         """Access first parameter in self, self inheriting from sklearn BaseForest.
 
-        The attribute was renamed from base_estimator to estimator in sklearn 1.2.0.
+        The attribute name is resolved once at import time, so the per-access
+        cost is a plain getattr rather than a version parse.
         """
-        import sklearn
-        from packaging.specifiers import SpecifierSet
-
-        sklearn_version = sklearn.__version__
-
-        if sklearn_version in SpecifierSet(">=1.2.0"):
-            return self.estimator
-        else:
-            return self.base_estimator
+        return getattr(self, _SKLEARN_ESTIMATOR_ATTR)
 
     def _fit(self, X, y):
         """Build a forest of trees from the training set (X, y).
@@ -88,30 +121,51 @@ class BaseTimeSeriesForest:
         self : object
             An fitted instance of the classifier
         """
-        X = X.squeeze(1)
+        # drop the singleton channel axis of univariate panels by reshaping,
+        # which stays a view where squeeze could force a copy for
+        # non-contiguous inputs
+        if X.ndim == 3 and X.shape[1] == 1:
+            X = X.reshape(X.shape[0], X.shape[2])
         n_instances, self.series_length = X.shape
 
         n_jobs = check_n_jobs(self.n_jobs)
 
         rng = check_random_state(self.random_state)
 
-        self.n_classes = np.unique(y).shape[0]
-
-        self.classes_ = class_distribution(np.asarray(y).reshape(-1, 1))[0][0]
+        # one pass over y finds both the classes and their number; the
+        # multilabel/sparse handling of sklearn's class_distribution is not
+        # needed here
+        self.classes_, _ = np.unique(y, return_counts=True)
+        self.n_classes = self.classes_.shape[0]
         self.n_intervals = int(math.sqrt(self.series_length))
         if self.n_intervals == 0:
             self.n_intervals = 1
         if self.series_length < self.min_interval:
             self.min_interval = self.series_length
 
-        self.intervals_ = [
-            _get_intervals(self.n_intervals, self.min_interval, self.series_length, rng)
-            for _ in range(self.n_estimators)
-        ]
+        self.intervals_ = _get_all_intervals(
+            self.n_estimators,
+            self.n_intervals,
+            self.min_interval,
+            self.series_length,
+            rng,
+        )
 
-        self.estimators_ = Parallel(n_jobs=n_jobs)(
+        # the trees are fitted over threads rather than processes: X is shared
+        # rather than pickled into every worker, and both the numba transform
+        # kernel and the sklearn tree builder release the GIL; float32 halves
+        # the bytes scanned and matches what the sklearn trees use internally
+        X = np.ascontiguousarray(X, dtype=np.float32)
+
+        # the prefix sums are identical for every estimator, so the single
+        # pass over X is hoisted out of the parallel loop, and the transforms
+        # for all estimators are derived from them in one vectorized batch;
+        # workers then only fit their tree on a zero-copy slice
+        prefix = _prefix_sums(X)
+        all_transformed = _transform_batched(prefix, self.intervals_)
+        self.estimators_ = Parallel(n_jobs=n_jobs, backend="threading")(
             delayed(_fit_estimator)(
-                _clone_estimator(self._estimator, rng), X, y, self.intervals_[i]
+                _clone_estimator(self._estimator, rng), all_transformed[i], y
             )
             for i in range(self.n_estimators)
         )
@@ -144,34 +198,205 @@ def _transform(X, intervals):
     Xt: np.ndarray or pd.DataFrame
      Transformed X, containing the mean, std and slope for each interval
     """
-    n_instances, _ = X.shape
+    # the numba kernel indexes X without bounds checking, so intervals that
+    # were generated for longer series must be rejected here
+    if intervals[:, 1].max() > X.shape[1]:
+        raise ValueError(
+            "At least one interval extends beyond the series length of X; "
+            "the intervals were generated for longer series."
+        )
+    if _NUMBA_PRESENT:
+        from sktime.series_as_features.base.estimators.interval_based import (
+            _tsf_numba,
+        )
+
+        if X.dtype != np.float32:
+            X = np.ascontiguousarray(X, dtype=np.float64)
+        t_sum, slope_norm = _slope_tables(X.shape[1])
+        return _tsf_numba._transform_numba(
+            X,
+            np.ascontiguousarray(intervals, dtype=np.int64),
+            t_sum,
+            slope_norm,
+        )
+    return _transform_numpy(X, intervals)
+
+
+def _transform_numpy(X, intervals):
+    """Compute the transform of X in pure numpy, for when numba is not present."""
+    return _transform_from_prefix(_prefix_sums(X), intervals)
+
+
+def _prefix_sums(X):
+    """Compute cumulative sums of X, X ** 2 and t * X over the time axis.
+
+    These allow the sum of any of the three over an arbitrary interval to be
+    computed as a single subtraction, so a transform over n_intervals costs
+    O(series_length + n_intervals) rather than O(n_intervals * interval_length).
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_instances, series_length)
+        Panel data to transform.
+
+    Returns
+    -------
+    tuple of 3 np.ndarray of shape (n_instances, series_length + 1)
+        Cumulative sums of X, X ** 2 and t * X, each starting with a zero
+        column so that interval sums are ``c[:, end] - c[:, start]``.
+    """
+    n_instances, series_length = X.shape
+    t = np.arange(series_length)
+    # X is scanned in its own (possibly float32) dtype, but the running sums
+    # accumulate in float64: the variance is a difference of two near-equal
+    # prefix values, which loses too many digits in single precision
+    cX = np.zeros((n_instances, series_length + 1))
+    cX2 = np.zeros((n_instances, series_length + 1))
+    cXt = np.zeros((n_instances, series_length + 1))
+    np.cumsum(X, axis=1, out=cX[:, 1:])
+    np.cumsum(X * X, axis=1, out=cX2[:, 1:])
+    np.cumsum(X * t, axis=1, out=cXt[:, 1:])
+    return cX, cX2, cXt
+
+
+def _transform_from_prefix(prefix, intervals):
+    """Compute the interval transform from precomputed prefix sums.
+
+    Parameters
+    ----------
+    prefix : tuple of 3 np.ndarray
+        Prefix sums of X, X ** 2 and t * X as returned by ``_prefix_sums``.
+    intervals : np.ndarray
+        Intervals containing start and end values.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances, 3 * n_intervals)
+        Transformed X, containing the mean, std and slope for each interval.
+    """
+    cX, cX2, cXt = prefix
+    n_instances, _ = cX.shape
     n_intervals, _ = intervals.shape
-    transformed_x = np.empty(shape=(3 * n_intervals, n_instances), dtype=np.float32)
-    for j in range(n_intervals):
-        X_slice = X[:, intervals[j][0] : intervals[j][1]]
-        means = np.mean(X_slice, axis=1)
-        std_dev = np.std(X_slice, axis=1)
-        slope = _slope(X_slice, axis=1)
-        transformed_x[3 * j] = means
-        transformed_x[3 * j + 1] = std_dev
-        transformed_x[3 * j + 2] = slope
+    series_length = cX.shape[1] - 1
+    t_sum_table, slope_norm_table = _slope_tables(series_length)
+
+    starts = intervals[:, 0]
+    ends = intervals[:, 1]
+    lengths = ends - starts
+
+    sums = cX[:, ends] - cX[:, starts]
+    sq_sums = cX2[:, ends] - cX2[:, starts]
+    t_sums = cXt[:, ends] - cXt[:, starts]
+
+    means = sums / lengths
+    variances = np.maximum(sq_sums / lengths - means * means, 0)
+    std_dev = np.sqrt(variances)
+    # shift the time-weighted sums to each interval's own 0..length-1 index;
+    # the float64 per-length moments then give the least-squares slope without
+    # the int64 overflow an absolute-index denominator hits on long series
+    t_sums_rel = t_sums - starts * sums
+    t_sum = t_sum_table[lengths]
+    slopes = (lengths * t_sums_rel - t_sum * sums) * slope_norm_table[lengths]
 
-    return transformed_x.T
+    # allocate directly in the (n_instances, n_features) C-contiguous layout
+    # the sklearn tree fitter wants, avoiding its internal copy of a
+    # transposed view
+    transformed_x = np.empty((n_instances, 3 * n_intervals), dtype=np.float32)
+    transformed_x[:, 0::3] = means
+    transformed_x[:, 1::3] = std_dev
+    transformed_x[:, 2::3] = slopes
+
+    return transformed_x
+
+
+def _transform_batched(prefix, all_intervals):
+    """Compute the interval transform for all estimators in one batch.
+
+    Parameters
+    ----------
+    prefix : tuple of 3 np.ndarray
+        Prefix sums of X, X ** 2 and t * X as returned by ``_prefix_sums``.
+    all_intervals : np.ndarray of shape (n_estimators, n_intervals, 2)
+        Stacked intervals as returned by ``_get_all_intervals``.
+
+    Returns
+    -------
+    np.ndarray of shape (n_estimators, n_instances, 3 * n_intervals)
+        Transformed X per estimator; slices along the first axis are
+        C-contiguous views suitable for fitting the trees directly.
+    """
+    cX, cX2, cXt = prefix
+    n_instances = cX.shape[0]
+    series_length = cX.shape[1] - 1
+    n_estimators, n_intervals, _ = all_intervals.shape
+    t_sum_table, slope_norm_table = _slope_tables(series_length)
+
+    starts = all_intervals[..., 0]
+    ends = all_intervals[..., 1]
+    lengths = (ends - starts)[:, np.newaxis, :]
+
+    # fancy-indexing the prefix arrays with the (n_estimators, n_intervals)
+    # index puts the instance axis first; moveaxis restores the estimator-
+    # leading layout so everything broadcasts per estimator
+    sums = np.moveaxis(cX[:, ends] - cX[:, starts], 0, 1)
+    sq_sums = np.moveaxis(cX2[:, ends] - cX2[:, starts], 0, 1)
+    t_sums = np.moveaxis(cXt[:, ends] - cXt[:, starts], 0, 1)
+
+    means = sums / lengths
+    variances = np.maximum(sq_sums / lengths - means * means, 0)
+    std_dev = np.sqrt(variances)
+    # as in _transform_from_prefix, slopes come from interval-relative time
+    # sums and the float64 per-length moments, avoiding int64 overflow
+    t_sums_rel = t_sums - starts[:, np.newaxis, :] * sums
+    t_sum = t_sum_table[lengths]
+    slopes = (lengths * t_sums_rel - t_sum * sums) * slope_norm_table[lengths]
+
+    transformed_x = np.empty(
+        (n_estimators, n_instances, 3 * n_intervals), dtype=np.float32
+    )
+    transformed_x[..., 0::3] = means
+    transformed_x[..., 1::3] = std_dev
+    transformed_x[..., 2::3] = slopes
+
+    return transformed_x
 
 
 def _get_intervals(n_intervals, min_interval, series_length, rng):
     """Generate random intervals for given parameters."""
-    intervals = np.zeros((n_intervals, 2), dtype=int)
-    for j in range(n_intervals):
-        intervals[j][0] = rng.randint(series_length - min_interval)
-        length = rng.randint(series_length - intervals[j][0] - 1)
-        if length < min_interval:
-            length = min_interval
-        intervals[j][1] = intervals[j][0] + length
-    return intervals
-
-
-def _fit_estimator(estimator, X, y, intervals):
-    """Fit an estimator on input data (X, y)."""
-    transformed_x = _transform(X, intervals)
+    return _get_all_intervals(1, n_intervals, min_interval, series_length, rng)[0]
+
+
+def _get_all_intervals(n_estimators, n_intervals, min_interval, series_length, rng):
+    """Generate random intervals for all estimators in one batch.
+
+    Parameters
+    ----------
+    n_estimators : int
+        Number of estimators to generate intervals for.
+    n_intervals : int
+        Number of intervals per estimator.
+    min_interval : int
+        Minimum length of an interval.
+    series_length : int
+        Length of the series the intervals are drawn from.
+    rng : np.random.RandomState
+        Random number generator.
+
+    Returns
+    -------
+    np.ndarray of shape (n_estimators, n_intervals, 2)
+        Start and end values of each interval.
+    """
+    size = (n_estimators, n_intervals)
+    starts = rng.randint(series_length - min_interval, size=size)
+    # a uniform draw in [0, series_length - start - 1) per interval,
+    # done as one vectorized call since randint has no per-element high
+    max_length = series_length - starts - 1
+    lengths = (rng.random_sample(size) * max_length).astype(int)
+    np.maximum(lengths, min_interval, out=lengths)
+    return np.stack([starts, starts + lengths], axis=-1)
+
+
+def _fit_estimator(estimator, transformed_x, y):
+    """Fit an estimator on already transformed input data."""
     return estimator.fit(transformed_x, y)
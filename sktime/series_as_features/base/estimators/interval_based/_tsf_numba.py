@@ -0,0 +1,73 @@
+"""Isolated numba imports for _tsf."""
+
+__author__ = ["TonyBagnall", "kkoziara", "luiszugasti", "kanand77"]
+
+import numpy as np
+
+from sktime.utils.numba.njit import njit
+
+
+@njit(
+    [
+        "float32[:, :](float32[:, :], int64[:, :], float64[:], float64[:])",
+        "float32[:, :](float64[:, :], int64[:, :], float64[:], float64[:])",
+    ],
+    nogil=True,
+    fastmath=True,
+    cache=True,
+)
+def _transform_numba(X, intervals, t_sum_table, slope_norm_table):
+    """Compute the mean, std and slope for given intervals of input data X.
+
+    Fused kernel over (instances x intervals): each slice of X is read once,
+    accumulating sum, sum of squares and the time-weighted sum from which all
+    three statistics follow in closed form. The kernel releases the GIL and
+    is single-threaded so that concurrent callers, such as the threading
+    joblib backend used by BaseTimeSeriesForest, do not over-subscribe cores.
+    Explicit float32/float64 signatures avoid a recompile per novel input
+    dtype, and the per-length slope constants come in precomputed so the
+    slope is a single multiply instead of reductions plus a division.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_instances, series_length)
+        Panel data to transform.
+    intervals : np.ndarray of shape (n_intervals, 2)
+        Intervals containing start and end values.
+    t_sum_table : np.ndarray of shape (series_length + 1,)
+        Sum of the time index 0..length-1 for every interval length.
+    slope_norm_table : np.ndarray of shape (series_length + 1,)
+        Reciprocal of the slope denominator for every interval length, as
+        returned by ``_slope_tables``.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances, 3 * n_intervals)
+        Transformed X, containing the mean, std and slope for each interval.
+    """
+    n_instances, _ = X.shape
+    n_intervals, _ = intervals.shape
+    transformed_x = np.empty((n_instances, 3 * n_intervals), dtype=np.float32)
+    for i in range(n_instances):
+        for j in range(n_intervals):
+            start = intervals[j, 0]
+            end = intervals[j, 1]
+            length = end - start
+            s = 0.0
+            s2 = 0.0
+            sxy = 0.0
+            for k in range(start, end):
+                value = X[i, k]
+                s += value
+                s2 += value * value
+                sxy += (k - start) * value
+            mean = s / length
+            var = s2 / length - mean * mean
+            if var < 0.0:
+                var = 0.0
+            transformed_x[i, 3 * j] = mean
+            transformed_x[i, 3 * j + 1] = np.sqrt(var)
+            transformed_x[i, 3 * j + 2] = (
+                length * sxy - s * t_sum_table[length]
+            ) * slope_norm_table[length]
+    return transformed_x
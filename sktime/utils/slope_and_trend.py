@@ -71,14 +71,15 @@ def _slope(y, axis=0):
         y = y.reshape(-1, 1)
 
     # Generate time index with correct shape for broadcasting
+    n = y.shape[axis]
     shape = np.ones(y.ndim, dtype=int)
     shape[axis] *= -1
-    x = np.arange(y.shape[axis]).reshape(shape) + 1
+    x = np.arange(n).reshape(shape) + 1
 
-    # Precompute mean
-    x_mean = x.mean()
+    # Mean and population variance of 1, ..., n in closed form, so the only
+    # reduction left is the single pass over y * x
+    x_mean = (n + 1) / 2
+    x_var = (n * n - 1) / 12
 
     # Compute slope along given axis
-    return (np.mean(y * x, axis=axis) - x_mean * np.mean(y, axis=axis)) / (
-        (x * x).mean() - x_mean**2
-    )
+    return (np.mean(y * x, axis=axis) - x_mean * np.mean(y, axis=axis)) / x_var